@@ -1,26 +1,69 @@
-"""Core DSPy Ozempic classifier package."""
-
-from .common import (
-    CLASSIFICATION_CONFIGS,
-    ClassificationConfig,
-    ComplaintClassifier,
-    classification_metric,
-    configure_lm,
-    create_classification_signature,
-    evaluate_model,
-    prepare_datasets,
-)
-from .serving.service import (
-    AECategoryRequest,
-    AEPCRequest,
-    ComplaintRequest,
-    ComplaintResponse,
-    PCCategoryRequest,
-    get_ae_category_classifier,
-    get_ae_pc_classifier,
-    get_classification_function,
-    get_pc_category_classifier,
-)
+"""Core DSPy Ozempic classifier package.
+
+Exports are resolved lazily (PEP 562); see ``src.common`` for the rationale.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .common import (
+        CLASSIFICATION_CONFIGS,
+        ClassificationConfig,
+        ComplaintClassifier,
+        classification_metric,
+        configure_lm,
+        create_classification_signature,
+        evaluate_model,
+        prepare_datasets,
+    )
+    from .serving.service import (
+        AECategoryRequest,
+        AEPCRequest,
+        ComplaintRequest,
+        ComplaintResponse,
+        PCCategoryRequest,
+        get_ae_category_classifier,
+        get_ae_pc_classifier,
+        get_classification_function,
+        get_pc_category_classifier,
+    )
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "CLASSIFICATION_CONFIGS": ".common",
+    "ClassificationConfig": ".common",
+    "create_classification_signature": ".common",
+    "ComplaintClassifier": ".common",
+    "classification_metric": ".common",
+    "configure_lm": ".common",
+    "evaluate_model": ".common",
+    "prepare_datasets": ".common",
+    "ComplaintRequest": ".serving.service",
+    "AEPCRequest": ".serving.service",
+    "AECategoryRequest": ".serving.service",
+    "PCCategoryRequest": ".serving.service",
+    "ComplaintResponse": ".serving.service",
+    "get_ae_pc_classifier": ".serving.service",
+    "get_ae_category_classifier": ".serving.service",
+    "get_pc_category_classifier": ".serving.service",
+    "get_classification_function": ".serving.service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     "CLASSIFICATION_CONFIGS",
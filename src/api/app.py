@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
+import os
+import secrets
+from collections.abc import Sequence
 from contextlib import asynccontextmanager
-from uuid import uuid4
+from typing import Annotated
 
 from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
+from pydantic import Field
 
 from ..common.config import configure_lm
 from ..common.types import ClassificationType
 from ..serving.service import (
+    INVALID_CLASSIFICATION,
+    MIN_COMPLAINT_LENGTH,
     AECategoryRequest,
     AEPCRequest,
+    BatchCoalescer,
+    ComplaintError,
+    ComplaintRequest,
     ComplaintResponse,
     PCCategoryRequest,
     get_ae_category_classifier,
@@ -20,6 +32,26 @@ from ..serving.service import (
     get_pc_category_classifier,
 )
 
+# Request IDs are a per-process random prefix plus a monotonic counter, which avoids
+# an os.urandom syscall per request while staying unique across workers.
+_REQUEST_ID_PREFIX = secrets.token_hex(4)
+_REQUEST_ID_COUNTER = itertools.count()
+
+_WARMUP_COMPLAINT = "My Ozempic pen arrived on time and works as expected."
+DEFAULT_WARMUP_TIMEOUT_S = 15.0
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+async def _warm_up_predictor(classification_type: ClassificationType, predictor, request_cls) -> None:
+    """Run one throwaway prediction so adapter/provider setup happens before real traffic."""
+    try:
+        await asyncio.to_thread(predictor, request_cls(complaint=_WARMUP_COMPLAINT))
+    except Exception as exc:  # noqa: BLE001 - a failed warmup must not abort startup
+        logger.warning("Warmup failed for {} classifier: {}", classification_type, exc)
+
 
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
@@ -27,25 +59,65 @@ async def _lifespan(app: FastAPI):
 
     app.state.errors = {}
 
-    try:
-        app.state.ae_pc_predictor = get_ae_pc_classifier()
-    except FileNotFoundError as exc:
-        app.state.ae_pc_predictor = None
-        app.state.errors[ClassificationType.AE_PC] = str(exc)
-
-    try:
-        app.state.ae_category_predictor = get_ae_category_classifier()
-    except FileNotFoundError as exc:
-        app.state.ae_category_predictor = None
-        app.state.errors[ClassificationType.AE_CATEGORY] = str(exc)
+    # Deserializing each DSPy program is independent, so load all three on worker threads at once.
+    loaders = [
+        ("ae_pc_predictor", ClassificationType.AE_PC, get_ae_pc_classifier),
+        ("ae_category_predictor", ClassificationType.AE_CATEGORY, get_ae_category_classifier),
+        ("pc_category_predictor", ClassificationType.PC_CATEGORY, get_pc_category_classifier),
+    ]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(loader) for _, _, loader in loaders),
+        return_exceptions=True,
+    )
+    for (state_attr, classification_type, _), result in zip(loaders, results, strict=True):
+        if isinstance(result, FileNotFoundError):
+            setattr(app.state, state_attr, None)
+            app.state.errors[classification_type] = str(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            setattr(app.state, state_attr, result)
+
+    # Trades a few seconds of startup (one LM call per classifier) for a first request
+    # that does not pay DSPy adapter and LiteLLM provider initialization.
+    if not _env_flag("DSPY_SKIP_WARMUP"):
+        warmups = [
+            (ClassificationType.AE_PC, app.state.ae_pc_predictor, AEPCRequest),
+            (ClassificationType.AE_CATEGORY, app.state.ae_category_predictor, AECategoryRequest),
+            (ClassificationType.PC_CATEGORY, app.state.pc_category_predictor, PCCategoryRequest),
+        ]
+        timeout_s = float(os.getenv("DSPY_WARMUP_TIMEOUT_S") or DEFAULT_WARMUP_TIMEOUT_S)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(
+                        _warm_up_predictor(classification_type, predictor, request_cls)
+                        for classification_type, predictor, request_cls in warmups
+                        if predictor is not None
+                    )
+                ),
+                timeout=timeout_s,
+            )
+        except TimeoutError:
+            # A slow or unreachable provider must not hold up startup; the abandoned calls
+            # finish (or fail) on their worker threads.
+            logger.warning("Warmup did not finish within {}s; serving without it", timeout_s)
+
+    # Opt-in micro-batching: concurrent single-complaint requests share one classifier.batch call.
+    app.state.coalescers = {}
+    if _env_flag("DSPY_BATCH_COALESCE"):
+        for classification_type, predictor in (
+            (ClassificationType.AE_PC, app.state.ae_pc_predictor),
+            (ClassificationType.AE_CATEGORY, app.state.ae_category_predictor),
+            (ClassificationType.PC_CATEGORY, app.state.pc_category_predictor),
+        ):
+            if predictor is not None:
+                app.state.coalescers[classification_type] = BatchCoalescer.from_env(predictor)
 
     try:
-        app.state.pc_category_predictor = get_pc_category_classifier()
-    except FileNotFoundError as exc:
-        app.state.pc_category_predictor = None
-        app.state.errors[ClassificationType.PC_CATEGORY] = str(exc)
-
-    yield
+        yield
+    finally:
+        await asyncio.gather(*(coalescer.aclose() for coalescer in app.state.coalescers.values()))
 
 
 app = FastAPI(
@@ -66,9 +138,27 @@ app = FastAPI(
 )
 
 
+def _require_predictor(state_attr: str, classification_type: ClassificationType, label: str):
+    predictor = getattr(app.state, state_attr, None)
+    if predictor is None:
+        error_detail = app.state.errors.get(classification_type, "Classifier artifact not loaded")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{label} classifier unavailable: {error_detail}",
+        )
+    return predictor
+
+
+async def _classify(classification_type: ClassificationType, predictor, payload: ComplaintRequest) -> ComplaintResponse:
+    coalescer: BatchCoalescer | None = getattr(app.state, "coalescers", {}).get(classification_type)
+    if coalescer is not None:
+        return await coalescer.submit(payload)
+    return await run_in_threadpool(predictor, payload)
+
+
 @app.middleware("http")
 async def request_id_middleware(request: Request, call_next):
-    request_id = request.headers.get("X-Request-ID") or uuid4().hex
+    request_id = request.headers.get("X-Request-ID") or f"{_REQUEST_ID_PREFIX}{next(_REQUEST_ID_COUNTER):024x}"
     request.state.request_id = request_id
     request.state.logger = logger.bind(request_id=request_id)
 
@@ -90,6 +180,9 @@ def root() -> dict[str, str | dict[str, str]]:
             "ae_pc": "/classify/ae-pc",
             "ae_category": "/classify/ae-category",
             "pc_category": "/classify/pc-category",
+            "ae_pc_batch": "/classify/ae-pc/batch",
+            "ae_category_batch": "/classify/ae-category/batch",
+            "pc_category_batch": "/classify/pc-category/batch",
         },
     }
 
@@ -117,6 +210,12 @@ def healthcheck() -> dict[str, str | dict]:
     return response
 
 
+_SHORT_COMPLAINT_NOTE = (
+    f" Complaints with fewer than {MIN_COMPLAINT_LENGTH} non-whitespace characters are returned as "
+    f"`{INVALID_CLASSIFICATION}` without calling the model."
+)
+
+
 @app.post(
     "/classify/ae-pc",
     response_model=ComplaintResponse,
@@ -124,19 +223,13 @@ def healthcheck() -> dict[str, str | dict]:
     summary="Classify as Adverse Event or Product Complaint",
     description=(
         "First-stage classification that determines whether a complaint is "
-        "an Adverse Event (medical/health issue) or a Product Complaint (quality/defect issue)."
+        "an Adverse Event (medical/health issue) or a Product Complaint (quality/defect issue)." + _SHORT_COMPLAINT_NOTE
     ),
     tags=["classification"],
 )
-def classify_ae_pc(payload: AEPCRequest) -> ComplaintResponse:
-    predictor = getattr(app.state, "ae_pc_predictor", None)
-    if predictor is None:
-        error_detail = app.state.errors.get(ClassificationType.AE_PC, "Classifier artifact not loaded")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"AE-PC classifier unavailable: {error_detail}",
-        )
-    return predictor(payload)
+async def classify_ae_pc(payload: AEPCRequest) -> ComplaintResponse:
+    predictor = _require_predictor("ae_pc_predictor", ClassificationType.AE_PC, "AE-PC")
+    return await _classify(ClassificationType.AE_PC, predictor, payload)
 
 
 @app.post(
@@ -146,19 +239,13 @@ def classify_ae_pc(payload: AEPCRequest) -> ComplaintResponse:
     summary="Classify Adverse Event into medical category",
     description=(
         "Second-stage classification for Adverse Events. Classifies into specific medical categories "
-        "such as Gastrointestinal disorders, Pancreatitis, Hypoglycemia, etc."
+        "such as Gastrointestinal disorders, Pancreatitis, Hypoglycemia, etc." + _SHORT_COMPLAINT_NOTE
     ),
     tags=["classification"],
 )
-def classify_ae_category(payload: AECategoryRequest) -> ComplaintResponse:
-    predictor = getattr(app.state, "ae_category_predictor", None)
-    if predictor is None:
-        error_detail = app.state.errors.get(ClassificationType.AE_CATEGORY, "Classifier artifact not loaded")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"AE-Category classifier unavailable: {error_detail}",
-        )
-    return predictor(payload)
+async def classify_ae_category(payload: AECategoryRequest) -> ComplaintResponse:
+    predictor = _require_predictor("ae_category_predictor", ClassificationType.AE_CATEGORY, "AE-Category")
+    return await _classify(ClassificationType.AE_CATEGORY, predictor, payload)
 
 
 @app.post(
@@ -168,19 +255,84 @@ def classify_ae_category(payload: AECategoryRequest) -> ComplaintResponse:
     summary="Classify Product Complaint into quality/defect category",
     description=(
         "Second-stage classification for Product Complaints. Classifies into specific categories "
-        "such as Device malfunction, Storage/Temperature excursion, Packaging defect, etc."
+        "such as Device malfunction, Storage/Temperature excursion, Packaging defect, etc." + _SHORT_COMPLAINT_NOTE
     ),
     tags=["classification"],
 )
-def classify_pc_category(payload: PCCategoryRequest) -> ComplaintResponse:
-    predictor = getattr(app.state, "pc_category_predictor", None)
-    if predictor is None:
-        error_detail = app.state.errors.get(ClassificationType.PC_CATEGORY, "Classifier artifact not loaded")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"PC-Category classifier unavailable: {error_detail}",
-        )
-    return predictor(payload)
+async def classify_pc_category(payload: PCCategoryRequest) -> ComplaintResponse:
+    predictor = _require_predictor("pc_category_predictor", ClassificationType.PC_CATEGORY, "PC-Category")
+    return await _classify(ClassificationType.PC_CATEGORY, predictor, payload)
+
+
+# Upper bound on complaints per batch request; larger payloads are rejected with 422 before any LM call.
+MAX_BATCH_ITEMS = 64
+
+_BATCH_DESCRIPTION = (
+    "Classifies a list of complaints in one call. Predictions run concurrently on DSPy's thread pool "
+    "(size set by `DSPY_NUM_THREADS`) and results are returned in request order."
+    " A complaint whose prediction fails is returned as an error item; the rest of the batch is unaffected."
+    f" At most {MAX_BATCH_ITEMS} complaints are accepted per request." + _SHORT_COMPLAINT_NOTE
+)
+
+
+def _batch_items(
+    classification_type: ClassificationType, outcomes: Sequence[ComplaintResponse | Exception]
+) -> list[ComplaintResponse | ComplaintError]:
+    items: list[ComplaintResponse | ComplaintError] = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            logger.opt(exception=outcome).warning("{} batch item {} failed", classification_type, index)
+            outcome = ComplaintError(
+                error=f"Classification failed: {type(outcome).__name__}",
+                classification_type=classification_type.value,
+            )
+        items.append(outcome)
+    return items
+
+
+@app.post(
+    "/classify/ae-pc/batch",
+    response_model=list[ComplaintResponse | ComplaintError],
+    operation_id="classifyAePcBatch",
+    summary="Batch-classify as Adverse Event or Product Complaint",
+    description=_BATCH_DESCRIPTION,
+    tags=["classification"],
+)
+def classify_ae_pc_batch(
+    payload: Annotated[list[AEPCRequest], Field(max_length=MAX_BATCH_ITEMS)],
+) -> list[ComplaintResponse | ComplaintError]:
+    predictor = _require_predictor("ae_pc_predictor", ClassificationType.AE_PC, "AE-PC")
+    return _batch_items(ClassificationType.AE_PC, predictor.batch(payload))
+
+
+@app.post(
+    "/classify/ae-category/batch",
+    response_model=list[ComplaintResponse | ComplaintError],
+    operation_id="classifyAeCategoryBatch",
+    summary="Batch-classify Adverse Events into medical categories",
+    description=_BATCH_DESCRIPTION,
+    tags=["classification"],
+)
+def classify_ae_category_batch(
+    payload: Annotated[list[AECategoryRequest], Field(max_length=MAX_BATCH_ITEMS)],
+) -> list[ComplaintResponse | ComplaintError]:
+    predictor = _require_predictor("ae_category_predictor", ClassificationType.AE_CATEGORY, "AE-Category")
+    return _batch_items(ClassificationType.AE_CATEGORY, predictor.batch(payload))
+
+
+@app.post(
+    "/classify/pc-category/batch",
+    response_model=list[ComplaintResponse | ComplaintError],
+    operation_id="classifyPcCategoryBatch",
+    summary="Batch-classify Product Complaints into quality/defect categories",
+    description=_BATCH_DESCRIPTION,
+    tags=["classification"],
+)
+def classify_pc_category_batch(
+    payload: Annotated[list[PCCategoryRequest], Field(max_length=MAX_BATCH_ITEMS)],
+) -> list[ComplaintResponse | ComplaintError]:
+    predictor = _require_predictor("pc_category_predictor", ClassificationType.PC_CATEGORY, "PC-Category")
+    return _batch_items(ClassificationType.PC_CATEGORY, predictor.batch(payload))
 
 
 __all__ = ["app"]
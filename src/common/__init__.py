@@ -1,33 +1,82 @@
-"""Shared DSPy classifier components."""
-
-from .classifier import (
-    CLASSIFICATION_CONFIGS,
-    ClassificationConfig,
-    ComplaintClassifier,
-    classification_metric,
-    create_classification_signature,
-    evaluate_model,
-)
-from .config import (
-    DEFAULT_CACHE_DIR,
-    LLMConfig,
-    configure_lm,
-    ensure_dspy_cache_dir,
-    load_llm_config,
-)
-from .data_utils import prepare_datasets
-from .paths import (
-    ARTIFACTS_DIR,
-    CLASSIFICATION_TYPES,
-    DATA_DIR,
-    DEFAULT_CLASSIFICATION_TYPE,
-    ROOT_DIR,
-    get_classification_data_dir,
-    get_classifier_artifact_path,
-    get_test_data_path,
-    get_train_data_path,
-)
-from .types import ClassificationType
+"""Shared DSPy classifier components.
+
+Exports are resolved lazily (PEP 562) so that importing a lightweight submodule such as
+``src.common.paths`` does not pull in dspy and pydantic-settings.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .classifier import (
+        CLASSIFICATION_CONFIGS,
+        ClassificationConfig,
+        ComplaintClassifier,
+        classification_metric,
+        create_classification_signature,
+        evaluate_model,
+    )
+    from .config import (
+        DEFAULT_CACHE_DIR,
+        LLMConfig,
+        configure_lm,
+        ensure_dspy_cache_dir,
+        load_llm_config,
+    )
+    from .data_utils import prepare_datasets
+    from .paths import (
+        ARTIFACTS_DIR,
+        CLASSIFICATION_TYPES,
+        DATA_DIR,
+        DEFAULT_CLASSIFICATION_TYPE,
+        ROOT_DIR,
+        get_classification_data_dir,
+        get_classifier_artifact_path,
+        get_test_data_path,
+        get_train_data_path,
+    )
+    from .types import ClassificationType
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "CLASSIFICATION_CONFIGS": ".classifier",
+    "ClassificationConfig": ".classifier",
+    "create_classification_signature": ".classifier",
+    "ComplaintClassifier": ".classifier",
+    "classification_metric": ".classifier",
+    "evaluate_model": ".classifier",
+    "configure_lm": ".config",
+    "ensure_dspy_cache_dir": ".config",
+    "DEFAULT_CACHE_DIR": ".config",
+    "LLMConfig": ".config",
+    "load_llm_config": ".config",
+    "prepare_datasets": ".data_utils",
+    "ROOT_DIR": ".paths",
+    "DATA_DIR": ".paths",
+    "ARTIFACTS_DIR": ".paths",
+    "CLASSIFICATION_TYPES": ".paths",
+    "DEFAULT_CLASSIFICATION_TYPE": ".paths",
+    "ClassificationType": ".types",
+    "get_classification_data_dir": ".paths",
+    "get_train_data_path": ".paths",
+    "get_test_data_path": ".paths",
+    "get_classifier_artifact_path": ".paths",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     "CLASSIFICATION_CONFIGS",
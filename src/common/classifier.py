@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import dspy
+from dspy.utils.parallelizer import ParallelExecutor
+from loguru import logger
 from pydantic import BaseModel
 
 from .types import ClassificationType
@@ -114,31 +116,55 @@ def evaluate_model(
     total = len(dataset)
 
     if verbose:
-        print(f"\n{'=' * 60}")
-        print(f"Evaluating on {dataset_name} ({total} examples)")
-        print(f"{'=' * 60}\n")
-
-    for i, example in enumerate(dataset, start=1):
-        prediction = model(complaint=example.complaint)
+        logger.info("Evaluating on {dataset_name} ({total} examples)", dataset_name=dataset_name, total=total)
+
+    def predict_or_error(example: dspy.Example) -> tuple[dspy.Prediction | Exception]:
+        # Boxed so ParallelExecutor neither counts the failure toward max_errors nor drops it from the results.
+        try:
+            return (model(**example.inputs()),)
+        except Exception as exc:  # noqa: BLE001 - re-raised below in dataset order
+            return (exc,)
+
+    # Predictions fan out over DSPy's thread pool (dspy.settings.num_threads, set from DSPY_NUM_THREADS).
+    # Every example runs to completion so the failure reported is the first in dataset order, not the first to finish.
+    outcomes = ParallelExecutor(disable_progress_bar=True).execute(predict_or_error, dataset)
+    predictions: list[dspy.Prediction] = []
+    for i, (outcome,) in enumerate(outcomes, start=1):
+        if isinstance(outcome, Exception):
+            raise RuntimeError(f"Prediction failed for {dataset_name} example {i}/{total}: {outcome}") from outcome
+        predictions.append(outcome)
+
+    for i, (example, prediction) in enumerate(zip(dataset, predictions, strict=True), start=1):
         is_correct = classification_metric(example, prediction)
         correct += is_correct
 
         if verbose:
-            status = "✓" if is_correct else "✗"
-            print(f"{status} Example {i}/{total}")
-            print(f"  Complaint: {example.complaint[:80]}...")
-            print(f"  Predicted: {prediction.classification or '(None - truncated response)'}")
-            print(f"  Actual: {example.classification}")
+            # One structured record per example; the keyword fields also land in record["extra"].
+            message = "{status} Example {i}/{total} | complaint: {complaint_preview}... | predicted: {predicted} | actual: {actual}"
             if not is_correct:
-                print(f"  Justification: {prediction.justification or '(None)'}")
-            print()
+                message += " | justification: {justification}"
+            logger.info(
+                message,
+                status="✓" if is_correct else "✗",
+                i=i,
+                total=total,
+                complaint_preview=example.complaint[:80],
+                predicted=prediction.classification or "(None - truncated response)",
+                actual=example.classification,
+                correct=bool(is_correct),
+                justification=prediction.justification or "(None)",
+            )
 
     accuracy = correct / total
 
     if verbose:
-        print(f"{'=' * 60}")
-        print(f"Accuracy: {correct}/{total} = {accuracy:.1%}")
-        print(f"{'=' * 60}\n")
+        logger.info(
+            "Accuracy on {dataset_name}: {correct}/{total} = {accuracy:.1%}",
+            dataset_name=dataset_name,
+            correct=correct,
+            total=total,
+            accuracy=accuracy,
+        )
 
     return accuracy
 
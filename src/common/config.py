@@ -4,17 +4,27 @@ from __future__ import annotations
 
 import json
 import os
+from collections.abc import Callable
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import dspy
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+if TYPE_CHECKING:
+    import dspy
+
 DEFAULT_MODEL = "nvidia/nemotron-3-nano-30b-a3b:free"
 DEFAULT_LOCAL_MODEL = "Nemotron-3-Nano-30B-A3B-UD-Q3_K_XL.gguf"
 DEFAULT_OPENROUTER_BASE = "https://openrouter.ai/api/v1"
 DEFAULT_LOCAL_BASE = "http://localhost:8080/v1"
 DEFAULT_CACHE_DIR = Path("data/.dspy_cache")
+DEFAULT_ASYNC_MAX_WORKERS = 32
+
+# LiteLLM provider routing prefixes stripped by get_display_model_name().
+_KNOWN_PROVIDER_PREFIXES = frozenset({"openai", "openrouter", "anthropic", "azure", "huggingface"})
 
 
 class EnvironmentSettings(BaseSettings):
@@ -34,10 +44,33 @@ class EnvironmentSettings(BaseSettings):
     openrouter_http_referer: str | None = Field(None, alias="OPENROUTER_HTTP_REFERER")
     openrouter_app_title: str | None = Field(None, alias="OPENROUTER_APP_TITLE")
 
+    @cached_property
+    def extra_headers(self) -> dict[str, str]:
+        """Extra HTTP headers from DSPY_HTTP_HEADERS (JSON) and the OpenRouter fields, parsed once."""
+
+        headers: dict[str, str] = {}
+
+        if self.raw_http_headers:
+            try:
+                headers.update(orjson.loads(self.raw_http_headers))
+            except orjson.JSONDecodeError as exc:
+                raise ValueError("Invalid JSON in DSPY_HTTP_HEADERS environment variable") from exc
+
+        if self.openrouter_http_referer:
+            headers.setdefault("HTTP-Referer", self.openrouter_http_referer)
+
+        if self.openrouter_app_title:
+            headers.setdefault("X-Title", self.openrouter_app_title)
+
+        return headers
+
 
 class LLMConfig(BaseModel):
     """Runtime configuration for the underlying language model."""
 
+    # Frozen because load_llm_config() hands the same cached instance to every caller.
+    model_config = ConfigDict(frozen=True)
+
     model: str = DEFAULT_MODEL
     api_key: str | None = None
     api_base: str | None = None
@@ -55,22 +88,7 @@ class LLMConfig(BaseModel):
 
 def _load_extra_headers(env: EnvironmentSettings) -> dict[str, str]:
     """Build extra headers from env (JSON or individual fields)."""
-
-    headers: dict[str, str] = {}
-
-    if env.raw_http_headers:
-        try:
-            headers.update(json.loads(env.raw_http_headers))
-        except json.JSONDecodeError as exc:
-            raise ValueError("Invalid JSON in DSPY_HTTP_HEADERS environment variable") from exc
-
-    if env.openrouter_http_referer:
-        headers.setdefault("HTTP-Referer", env.openrouter_http_referer)
-
-    if env.openrouter_app_title:
-        headers.setdefault("X-Title", env.openrouter_app_title)
-
-    return headers
+    return env.extra_headers
 
 
 def _load_source_credentials() -> dict[str, object]:
@@ -131,25 +149,22 @@ def _get_openrouter_api_key_from_sources() -> str | None:
     return None
 
 
-def load_llm_config() -> LLMConfig:
-    """Load LM configuration from environment variables."""
+def _build_local_config(env: EnvironmentSettings) -> LLMConfig:
+    """Config for an OpenAI-compatible local server (e.g. llama.cpp)."""
+    model_name = env.model_name or DEFAULT_LOCAL_MODEL
+    # LiteLLM requires openai/ prefix for OpenAI-compatible local servers
+    if not model_name.startswith("openai/"):
+        model_name = f"openai/{model_name}"
+    return LLMConfig(
+        model=model_name,
+        api_key="dummy",  # LiteLLM requires a non-None api_key for openai provider
+        api_base=env.local_base or DEFAULT_LOCAL_BASE,
+        headers={},
+    )
 
-    env = EnvironmentSettings()  # pyright: ignore[reportCallIssue]
-    provider = env.provider.lower()
-
-    if provider == "local":
-        model_name = env.model_name or DEFAULT_LOCAL_MODEL
-        # LiteLLM requires openai/ prefix for OpenAI-compatible local servers
-        if not model_name.startswith("openai/"):
-            model_name = f"openai/{model_name}"
-        return LLMConfig(
-            model=model_name,
-            api_key="dummy",  # LiteLLM requires a non-None api_key for openai provider
-            api_base=env.local_base or DEFAULT_LOCAL_BASE,
-            headers={},
-        )
 
-    # OpenRouter provider (default)
+def _build_openrouter_config(env: EnvironmentSettings) -> LLMConfig:
+    """Config for OpenRouter, resolving the API key from env or compute module Sources."""
     openrouter_api_key = env.openrouter_api_key or _get_openrouter_api_key_from_sources()
     if not openrouter_api_key:
         raise RuntimeError(
@@ -170,32 +185,75 @@ def load_llm_config() -> LLMConfig:
     )
 
 
+# Keyed by lowercased DSPY_PROVIDER; unknown providers fall back to OpenRouter (the default).
+_PROVIDER_BUILDERS: dict[str, Callable[[EnvironmentSettings], LLMConfig]] = {
+    "local": _build_local_config,
+    "openrouter": _build_openrouter_config,
+}
+
+
+@lru_cache(maxsize=1)
+def load_llm_config() -> LLMConfig:
+    """Load LM configuration from environment variables.
+
+    The result is cached per process; call ``load_llm_config.cache_clear()`` after changing the environment.
+    """
+
+    env = EnvironmentSettings()  # pyright: ignore[reportCallIssue]
+    builder = _PROVIDER_BUILDERS.get(env.provider.lower(), _build_openrouter_config)
+    return builder(env)
+
+
+def _strip_provider_prefix(model: str) -> str:
+    provider, sep, name = model.partition("/")
+    return name if sep and provider in _KNOWN_PROVIDER_PREFIXES else model
+
+
+# Display name of the LM installed by configure_lm(), so callers skip the dspy.settings lookup.
+_CONFIGURED_DISPLAY_NAME: str | None = None
+
+
 def get_display_model_name(model: str | None = None) -> str | None:
     """Strip LiteLLM provider routing prefixes (openai/, openrouter/, etc.) for display/storage."""
     if model is None:
+        if _CONFIGURED_DISPLAY_NAME is not None:
+            return _CONFIGURED_DISPLAY_NAME
+
+        import dspy
+
         model = dspy.settings.lm.model if dspy.settings.lm else None
 
     if model is None:
         return None
 
-    prefixes = ("openai/", "openrouter/", "anthropic/", "azure/", "huggingface/")
-    for prefix in prefixes:
-        if model.startswith(prefix):
-            return model[len(prefix) :]
+    return _strip_provider_prefix(model)
 
-    return model
+
+_ENSURED_CACHE_DIR: Path | None = None
 
 
 def ensure_dspy_cache_dir(cache_dir: Path | None = None) -> Path:
-    """Ensure DSPy cache directory exists and is configured."""
+    """Ensure DSPy cache directory exists and is configured.
+
+    Only the first call for a given directory touches the filesystem.
+    """
+    global _ENSURED_CACHE_DIR
+
     path = cache_dir or DEFAULT_CACHE_DIR
+    if path == _ENSURED_CACHE_DIR:
+        return path
     path.mkdir(parents=True, exist_ok=True)
     os.environ.setdefault("DSPY_CACHEDIR", str(path))
+    _ENSURED_CACHE_DIR = path
     return path
 
 
 def configure_lm() -> dspy.LM:
     ensure_dspy_cache_dir()
+    # Imported here so config-only consumers (load_llm_config, paths) skip loading dspy/litellm,
+    # and after the cache dir is set so dspy picks up DSPY_CACHEDIR on first import.
+    import dspy
+
     cfg = load_llm_config()
     lm = dspy.LM(
         cfg.model,
@@ -205,7 +263,17 @@ def configure_lm() -> dspy.LM:
         max_tokens=8000,
         cache=False,
     )
-    dspy.configure(lm=lm)
+    # Caps concurrent LM calls dispatched through dspy.asyncify.
+    async_max_workers = int(os.getenv("DSPY_ASYNC_MAX_WORKERS") or DEFAULT_ASYNC_MAX_WORKERS)
+    settings: dict[str, object] = {"lm": lm, "async_max_workers": async_max_workers}
+    # Thread pool size for Module.batch, Evaluate and MIPROv2 candidate evaluation; unset keeps DSPy's default.
+    num_threads = os.getenv("DSPY_NUM_THREADS", "").strip()
+    if num_threads:
+        settings["num_threads"] = int(num_threads)
+    dspy.configure(**settings)
+
+    global _CONFIGURED_DISPLAY_NAME
+    _CONFIGURED_DISPLAY_NAME = _strip_provider_prefix(cfg.model)
     return lm
 
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 
 import dspy
+import orjson
 
 from .paths import (
     DEFAULT_CLASSIFICATION_TYPE,
@@ -16,14 +17,50 @@ from .types import ClassificationType
 
 
 def _load_split(path: Path, classification_type: ClassificationType) -> list[dict]:
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Dataset file '{path}' is missing for classification type '{classification_type}'. "
             f"Run the appropriate data generation script first."
-        )
+        ) from None
 
-    with path.open("r", encoding="utf-8") as fp:
-        return json.load(fp)
+    return _read_split(path, mtime_ns)
+
+
+@lru_cache(maxsize=2 * len(ClassificationType))
+def _read_split(path: Path, mtime_ns: int) -> list[dict]:
+    """Parse a dataset file, cached on its mtime so edits on disk invalidate the entry.
+
+    The returned rows are shared between callers and must not be mutated.
+    """
+    return orjson.loads(path.read_bytes())
+
+
+def _examples_from_complaint_rows(rows: list[dict]) -> list[dspy.Example]:
+    return [
+        dspy.Example(complaint=row["complaint"], classification=row["label"]).with_inputs("complaint") for row in rows
+    ]
+
+
+def _examples_from_narrative_rows(rows: list[dict]) -> list[dspy.Example]:
+    return [
+        dspy.Example(complaint=row["narrative"], classification=row["category"]).with_inputs("complaint")
+        for row in rows
+    ]
+
+
+def _to_examples(raw_batch: list[dict]) -> list[dspy.Example]:
+    """Convert raw rows to DSPy Examples.
+
+    The schema is consistent within a file, so the first row picks the converter:
+    "complaint"/"label" (AE vs PC) or the "narrative"/"category" layout (category datasets).
+    """
+    if not raw_batch:
+        return []
+    if "complaint" in raw_batch[0]:
+        return _examples_from_complaint_rows(raw_batch)
+    return _examples_from_narrative_rows(raw_batch)
 
 
 def prepare_datasets(
@@ -37,16 +74,6 @@ def prepare_datasets(
     train_raw = _load_split(train_path, classification_type)
     test_raw = _load_split(test_path, classification_type)
 
-    def _to_examples(raw_batch: list[dict]) -> list[dspy.Example]:
-        # Handle both "label" and "category" keys for backwards compatibility
-        return [
-            dspy.Example(
-                complaint=item.get("complaint") or item.get("narrative", ""),
-                classification=item.get("label") or item.get("category", ""),
-            ).with_inputs("complaint")
-            for item in raw_batch
-        ]
-
     return _to_examples(train_raw), _to_examples(test_raw)
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import NamedTuple
 
 from .types import ClassificationType
 
@@ -19,30 +20,58 @@ CLASSIFICATION_TYPES: dict[ClassificationType, str] = {
 DEFAULT_CLASSIFICATION_TYPE = ClassificationType.AE_PC
 
 
-def get_classification_data_dir(classification_type: ClassificationType = DEFAULT_CLASSIFICATION_TYPE) -> Path:
-    """Get the data directory for a specific classification type."""
-    if classification_type not in CLASSIFICATION_TYPES:
+class _ClassificationPaths(NamedTuple):
+    data_dir: Path
+    train: Path
+    test: Path
+    artifact: Path
+
+
+def _build_classification_paths(slug: str) -> _ClassificationPaths:
+    data_dir = DATA_DIR / slug
+    type_slug = slug.replace("-classification", "")
+    return _ClassificationPaths(
+        data_dir=data_dir,
+        train=data_dir / "train.json",
+        test=data_dir / "test.json",
+        artifact=ARTIFACTS_DIR / f"ozempic_classifier_{type_slug}_optimized.json",
+    )
+
+
+# Paths are resolved once at import; the getters below are plain lookups.
+_PATHS_BY_TYPE: dict[ClassificationType, _ClassificationPaths] = {
+    classification_type: _build_classification_paths(slug) for classification_type, slug in CLASSIFICATION_TYPES.items()
+}
+
+
+def _paths_for(classification_type: ClassificationType) -> _ClassificationPaths:
+    try:
+        return _PATHS_BY_TYPE[classification_type]
+    except KeyError:
         raise ValueError(
             f"Invalid classification type: {classification_type}. "
             f"Valid types: {', '.join(t.value for t in ClassificationType)}"
-        )
-    return DATA_DIR / CLASSIFICATION_TYPES[classification_type]
+        ) from None
+
+
+def get_classification_data_dir(classification_type: ClassificationType = DEFAULT_CLASSIFICATION_TYPE) -> Path:
+    """Get the data directory for a specific classification type."""
+    return _paths_for(classification_type).data_dir
 
 
 def get_train_data_path(classification_type: ClassificationType = DEFAULT_CLASSIFICATION_TYPE) -> Path:
     """Get the training data path for a specific classification type."""
-    return get_classification_data_dir(classification_type) / "train.json"
+    return _paths_for(classification_type).train
 
 
 def get_test_data_path(classification_type: ClassificationType = DEFAULT_CLASSIFICATION_TYPE) -> Path:
     """Get the test data path for a specific classification type."""
-    return get_classification_data_dir(classification_type) / "test.json"
+    return _paths_for(classification_type).test
 
 
 def get_classifier_artifact_path(classification_type: ClassificationType = DEFAULT_CLASSIFICATION_TYPE) -> Path:
     """Get the artifact path for a specific classification type."""
-    type_slug = CLASSIFICATION_TYPES[classification_type].replace("-classification", "")
-    return ARTIFACTS_DIR / f"ozempic_classifier_{type_slug}_optimized.json"
+    return _paths_for(classification_type).artifact
 
 
 __all__ = [
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
+import sqlite3
 import uuid
+from contextlib import closing
 from pathlib import Path
 
 import dspy
+import orjson
 from dspy.teleprompt import MIPROv2
+from dspy.utils.saving import get_dependency_versions
 
 import mlflow
 
@@ -32,15 +35,26 @@ from ..common.types import ClassificationType
 # MLflow configuration - SQLite backend for easy querying
 MLFLOW_DB_PATH = Path("mlflow/mlflow.db")
 MLFLOW_ARTIFACTS_PATH = Path("mlflow/artifacts")
+# Used instead of SQLite when DSPY_MLFLOW_BACKEND=file
+MLFLOW_FILE_STORE_PATH = Path("mlflow/mlruns")
 
 
 def setup_mlflow() -> None:
-    """Configure MLflow with SQLite backend."""
+    """Configure MLflow with SQLite backend (or the file store when ``DSPY_MLFLOW_BACKEND=file``)."""
     MLFLOW_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     MLFLOW_ARTIFACTS_PATH.mkdir(parents=True, exist_ok=True)
 
-    # Set tracking URI to SQLite database
-    mlflow.set_tracking_uri(f"sqlite:///{MLFLOW_DB_PATH}")
+    if os.getenv("DSPY_MLFLOW_BACKEND", "").strip().lower() == "file":
+        mlflow.set_tracking_uri(MLFLOW_FILE_STORE_PATH.absolute().as_uri())
+    else:
+        # WAL journaling is persisted in the database file, so MLflow's own connections pick it up and
+        # each commit appends to the WAL instead of rewriting the rollback journal. Readers such as
+        # `sqlite3 mlflow/mlflow.db` keep working while a run is in progress.
+        with closing(sqlite3.connect(MLFLOW_DB_PATH)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+
+        # Set tracking URI to SQLite database
+        mlflow.set_tracking_uri(f"sqlite:///{MLFLOW_DB_PATH}")
 
     # Set artifact location
     os.environ["MLFLOW_ARTIFACT_ROOT"] = str(MLFLOW_ARTIFACTS_PATH.absolute())
@@ -82,9 +96,9 @@ def run_pipeline(
         baseline_classifier = ComplaintClassifier(classification_type)
         print("  Evaluating baseline...")
         baseline_accuracy = evaluate_model(baseline_classifier, testset, "Test Set", verbose=verbose)
-        mlflow.log_metric("baseline_accuracy", baseline_accuracy)
 
         print("  Optimizing with MIPROv2...")
+        # Candidate evaluation runs on dspy.settings.num_threads (DSPY_NUM_THREADS via configure_lm).
         optimizer = MIPROv2(
             metric=classification_metric,
             auto="medium",
@@ -99,27 +113,28 @@ def run_pipeline(
 
         print("  Evaluating optimized...")
         optimized_accuracy = evaluate_model(optimized_classifier, testset, "Test Set", verbose=verbose)
-        mlflow.log_metric("optimized_accuracy", optimized_accuracy)
 
         improvement = optimized_accuracy - baseline_accuracy
-        mlflow.log_metric("improvement", improvement)
+        # One log_batch write for all run metrics instead of a tracking-store round trip per metric.
+        mlflow.log_metrics(
+            {
+                "baseline_accuracy": baseline_accuracy,
+                "optimized_accuracy": optimized_accuracy,
+                "improvement": improvement,
+            }
+        )
 
         ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
         artifact_path = get_classifier_artifact_path(classification_type)
-        optimized_classifier.save(str(artifact_path))
-
-        if model_name or classification_type:
-            with open(artifact_path) as f:
-                artifact_data = json.load(f)
-            if "metadata" not in artifact_data:
-                artifact_data["metadata"] = {}
-            if model_name:
-                artifact_data["metadata"]["model"] = model_name
-            artifact_data["metadata"]["classification_type"] = classification_type
-            artifact_data["metadata"]["classification_config"] = config.model_dump()
-            artifact_data["metadata"]["mlflow_run_id"] = run_id
-            with open(artifact_path, "w") as f:
-                json.dump(artifact_data, f, indent=2)
+        # Same layout as Module.save(), with our metadata stamped in so the artifact is written once.
+        artifact_data = optimized_classifier.dump_state()
+        metadata = artifact_data["metadata"] = {"dependency_versions": get_dependency_versions()}
+        if model_name:
+            metadata["model"] = model_name
+        metadata["classification_type"] = classification_type
+        metadata["classification_config"] = config.model_dump()
+        metadata["mlflow_run_id"] = run_id
+        artifact_path.write_bytes(orjson.dumps(artifact_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
 
         mlflow.log_artifact(str(artifact_path))
 
@@ -127,7 +142,7 @@ def run_pipeline(
         print(f"Artifact: {artifact_path}")
         active_run = mlflow.active_run()
         if active_run:
-            print(f"MLflow: sqlite:///{MLFLOW_DB_PATH} (run: {active_run.info.run_id})")
+            print(f"MLflow: {mlflow.get_tracking_uri()} (run: {active_run.info.run_id})")
 
 
 def main() -> None:
@@ -135,9 +150,9 @@ def main() -> None:
     parser.add_argument(
         "--classification-type",
         "-t",
-        type=str,
+        type=ClassificationType,
         default=DEFAULT_CLASSIFICATION_TYPE,
-        choices=list(CLASSIFICATION_TYPES.keys()),
+        choices=list(ClassificationType),
         help=f"Classification type to train (default: {DEFAULT_CLASSIFICATION_TYPE})",
     )
     parser.add_argument(
@@ -3,6 +3,8 @@
 from .service import (
     AECategoryRequest,
     AEPCRequest,
+    BatchCoalescer,
+    ClassificationFunction,
     ComplaintRequest,
     ComplaintResponse,
     PCCategoryRequest,
@@ -13,6 +15,8 @@ from .service import (
 )
 
 __all__ = [
+    "BatchCoalescer",
+    "ClassificationFunction",
     "ComplaintRequest",
     "AEPCRequest",
     "AECategoryRequest",
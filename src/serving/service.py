@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import mmap
 import os
-from collections.abc import Callable
-from functools import lru_cache
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from contextlib import AbstractContextManager, nullcontext
+from functools import cache
 from pathlib import Path
 
 import dspy
+import orjson
+from dspy.utils.parallelizer import ParallelExecutor
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..common.classifier import CLASSIFICATION_CONFIGS, ComplaintClassifier
@@ -75,15 +82,41 @@ class ComplaintResponse(BaseModel):
     classification_type: str = Field(..., description="The type of classification performed")
 
 
+class ComplaintError(BaseModel):
+    """A batch item that could not be classified."""
+
+    error: str = Field(..., description="Why the complaint could not be classified")
+    classification_type: str = Field(..., description="The type of classification attempted")
+
+
+# Artifact path -> (blake2b digest, metadata.model) as last seen, so unchanged artifacts skip the parse.
+# A content hash, unlike mtime, survives checkouts and image rebuilds that touch the file without changing it.
+_ARTIFACT_MODEL_CACHE: dict[Path, tuple[bytes, str | None]] = {}
+
+
+def _artifact_digest(data: bytes | memoryview) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
 def _update_artifact_model_metadata(model_path: Path, current_model: str) -> None:
+    # Hash and parse straight from a read-only mapping so the artifact is never copied into a bytes object.
     try:
-        artifact_data = json.loads(model_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        with (
+            model_path.open("rb") as artifact_file,
+            mmap.mmap(artifact_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            digest = _artifact_digest(view)
+            if _ARTIFACT_MODEL_CACHE.get(model_path) == (digest, current_model):
+                return
+            artifact_data = orjson.loads(view)
+    except (OSError, ValueError):  # ValueError covers empty files (mmap) and orjson.JSONDecodeError
         return
 
     metadata = artifact_data.get("metadata")
     saved_model = metadata.get("model") if isinstance(metadata, dict) else None
     if saved_model == current_model:
+        _ARTIFACT_MODEL_CACHE[model_path] = (digest, saved_model)
         return
 
     if not isinstance(metadata, dict):
@@ -91,10 +124,18 @@ def _update_artifact_model_metadata(model_path: Path, current_model: str) -> Non
         artifact_data["metadata"] = metadata
     metadata["model"] = current_model
 
+    updated = orjson.dumps(artifact_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
     tmp_path = model_path.with_suffix(f"{model_path.suffix}.tmp")
+    durable = _artifact_fsync_enabled()
     try:
-        tmp_path.write_text(json.dumps(artifact_data, indent=2) + "\n", encoding="utf-8")
+        with tmp_path.open("wb") as tmp_file:
+            tmp_file.write(updated)
+            if durable:
+                os.fsync(tmp_file.fileno())
         tmp_path.replace(model_path)
+        if durable:
+            _fsync_directory(model_path.parent)
+        _ARTIFACT_MODEL_CACHE[model_path] = (_artifact_digest(updated), current_model)
     except OSError:
         try:
             tmp_path.unlink(missing_ok=True)
@@ -102,13 +143,31 @@ def _update_artifact_model_metadata(model_path: Path, current_model: str) -> Non
             pass
 
 
-def _artifact_auto_update_enabled() -> bool:
-    if os.getenv("PYTEST_CURRENT_TEST"):
-        return False
-    flag = os.getenv("DSPY_ARTIFACT_AUTO_UPDATE", "").strip().lower()
+def _artifact_fsync_enabled() -> bool:
+    # Off by default: a file plus directory fsync costs milliseconds per rewrite and only matters if the
+    # host can crash between the rename and the next writeback.
+    flag = os.getenv("DSPY_ARTIFACT_FSYNC", "").strip().lower()
     return flag in {"1", "true", "yes", "on"}
 
 
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry so a completed rename survives a crash."""
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+# Read once at import; PYTEST_CURRENT_TEST stays a per-call check because pytest only sets it while a
+# test is running, after this module has been imported during collection.
+_AUTO_UPDATE_FLAG = os.getenv("DSPY_ARTIFACT_AUTO_UPDATE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _artifact_auto_update_enabled() -> bool:
+    return _AUTO_UPDATE_FLAG and not os.getenv("PYTEST_CURRENT_TEST")
+
+
 def _load_classifier(model_path: Path, classification_type: ClassificationType) -> ComplaintClassifier:
     """Load a classifier for a specific classification type."""
     classifier = ComplaintClassifier(classification_type)
@@ -119,16 +178,175 @@ def _load_classifier(model_path: Path, classification_type: ClassificationType)
     return classifier
 
 
-@lru_cache(maxsize=3)
+# (artifact path, classification type) -> (artifact st_mtime_ns, classifier). One entry per key, so a rewritten
+# artifact replaces its old classifier instead of leaving it behind.
+_CLASSIFIER_CACHE: dict[tuple[Path, ClassificationType], tuple[int, ComplaintClassifier]] = {}
+
+
 def _cached_classifier(model_path: Path, classification_type: ClassificationType) -> ComplaintClassifier:
-    """Cache classifiers by both path and classification type."""
-    return _load_classifier(model_path, classification_type)
+    """Cache classifiers by path and classification type, reloading when the artifact mtime changes.
+
+    Keying on ``st_mtime_ns`` means an artifact rewritten by ``run_pipeline`` is reloaded on the next call
+    instead of serving stale weights until restart.
+    """
+    key = (model_path, classification_type)
+    cached = _CLASSIFIER_CACHE.get(key)
+    if cached is not None and cached[0] == model_path.stat().st_mtime_ns:
+        return cached[1]
+    classifier = _load_classifier(model_path, classification_type)
+    # Stat after loading: the metadata auto-update may have just rewritten the artifact, and keying on the
+    # pre-load mtime would make the next call load it all over again.
+    _CLASSIFIER_CACHE[key] = (model_path.stat().st_mtime_ns, classifier)
+    return classifier
+
+
+_cached_classifier.cache_clear = _CLASSIFIER_CACHE.clear  # type: ignore[attr-defined]
+
+
+# DSPy appends every Predict call to dspy.settings.trace (up to max_trace_size entries) for optimizers and
+# inspect_history; serving never reads it, so DSPY_DISABLE_TRACE lets the hot path skip that bookkeeping.
+_DISABLE_TRACE = os.getenv("DSPY_DISABLE_TRACE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _prediction_context() -> AbstractContextManager[object]:
+    return dspy.context(trace=None) if _DISABLE_TRACE else nullcontext()
+
+
+# Complaints with fewer non-whitespace characters than this get a canned response without an LM call.
+MIN_COMPLAINT_LENGTH = 3
+INVALID_CLASSIFICATION = "Invalid"
+
+
+def _is_classifiable(request: ComplaintRequest) -> bool:
+    return len(request.complaint.strip()) >= MIN_COMPLAINT_LENGTH
+
+
+class _ResponseCache:
+    """Thread-safe LRU of responses keyed by a blake2b digest of the complaint text."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, ComplaintResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(complaint: str) -> bytes:
+        return hashlib.blake2b(complaint.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> ComplaintResponse | None:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: bytes, response: ComplaintResponse) -> None:
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class ClassificationFunction:
+    """Runs a loaded classifier for a single request or a batch of requests.
+
+    With a positive ``response_cache_size`` (default: ``DSPY_RESPONSE_CACHE_SIZE``), responses are memoized per
+    complaint text. The cache lives on this instance, so it is discarded along with the classifier it was built from.
+    """
+
+    def __init__(
+        self,
+        classifier: ComplaintClassifier,
+        classification_type: ClassificationType,
+        response_cache_size: int | None = None,
+    ) -> None:
+        self.classifier = classifier
+        self.classification_type = classification_type
+        if response_cache_size is None:
+            response_cache_size = int(os.getenv("DSPY_RESPONSE_CACHE_SIZE") or 0)
+        self._response_cache = _ResponseCache(response_cache_size) if response_cache_size > 0 else None
+
+    def _to_response(self, prediction: dspy.Prediction) -> ComplaintResponse:
+        # Skip field validation here: FastAPI validates against response_model when serializing anyway.
+        return ComplaintResponse.model_construct(
+            classification=prediction.classification,
+            justification=prediction.justification,
+            classification_type=self.classification_type.value,
+        )
+
+    def _invalid_response(self) -> ComplaintResponse:
+        return ComplaintResponse.model_construct(
+            classification=INVALID_CLASSIFICATION,
+            justification="Complaint text is empty or too short.",
+            classification_type=self.classification_type.value,
+        )
+
+    def _cached_response(self, request: ComplaintRequest) -> ComplaintResponse | None:
+        if self._response_cache is None:
+            return None
+        return self._response_cache.get(_ResponseCache.key(request.complaint))
+
+    def _remember(self, request: ComplaintRequest, response: ComplaintResponse) -> ComplaintResponse:
+        if self._response_cache is not None:
+            self._response_cache.put(_ResponseCache.key(request.complaint), response)
+        return response
+
+    def __call__(self, request: ComplaintRequest) -> ComplaintResponse:
+        if not _is_classifiable(request):
+            return self._invalid_response()
+        if (cached := self._cached_response(request)) is not None:
+            return cached
+        with _prediction_context():
+            prediction: dspy.Prediction = self.classifier(complaint=request.complaint)
+        return self._remember(request, self._to_response(prediction))
+
+    def _predict_or_error(self, request: ComplaintRequest) -> tuple[ComplaintResponse | Exception]:
+        # Boxed in a 1-tuple: ParallelExecutor treats a bare returned exception as a failure and drops it.
+        try:
+            prediction: dspy.Prediction = self.classifier(complaint=request.complaint)
+        except Exception as exc:  # noqa: BLE001 - returned so batch() can report it for this item only
+            return (exc,)
+        return (self._remember(request, self._to_response(prediction)),)
+
+    def batch(self, requests: Sequence[ComplaintRequest]) -> list[ComplaintResponse | Exception]:
+        """Classify several complaints concurrently on DSPy's thread pool.
+
+        Returns one outcome per request, in order: the response, or the exception raised while predicting that
+        complaint. A failing complaint never discards the predictions made for the others.
+        """
+        outcomes: list[ComplaintResponse | Exception | None] = []
+        pending: list[tuple[int, ComplaintRequest]] = []
+        for index, request in enumerate(requests):
+            if not _is_classifiable(request):
+                outcomes.append(self._invalid_response())
+            else:
+                outcomes.append(self._cached_response(request))
+                if outcomes[-1] is None:
+                    pending.append((index, request))
+        if not pending:
+            return outcomes  # type: ignore[return-value]
+
+        # Failures come back as values, so the executor never hits max_errors and cancels the rest of the batch.
+        # ParallelExecutor copies the caller's settings overrides into its worker threads.
+        executor = ParallelExecutor(disable_progress_bar=True)
+        with _prediction_context():
+            results = executor.execute(self._predict_or_error, [request for _, request in pending])
+
+        for (index, _), (outcome,) in zip(pending, results, strict=True):
+            outcomes[index] = outcome
+        return outcomes  # type: ignore[return-value]
+
+
+@cache
+def _resolved_artifact_path(classification_type: ClassificationType) -> Path:
+    return get_classifier_artifact_path(classification_type).expanduser().resolve()
 
 
 def _create_classification_function(
     classification_type: ClassificationType,
     use_cache: bool = True,
-) -> Callable[[ComplaintRequest], ComplaintResponse]:
+) -> ClassificationFunction:
     """Create a classification function for a specific classification type."""
     if classification_type not in CLASSIFICATION_CONFIGS:
         raise ValueError(
@@ -136,36 +354,134 @@ def _create_classification_function(
             f"Valid types: {', '.join(t.value for t in ClassificationType)}"
         )
 
-    model_path = get_classifier_artifact_path(classification_type)
-    resolved_path = model_path.expanduser().resolve()
+    resolved_path = _resolved_artifact_path(classification_type)
 
     if use_cache:
         classifier = _cached_classifier(resolved_path, classification_type)
     else:
         classifier = _load_classifier(resolved_path, classification_type)
 
-    def _predict(request: ComplaintRequest) -> ComplaintResponse:
-        prediction: dspy.Prediction = classifier(complaint=request.complaint)
-        return ComplaintResponse(
-            classification=prediction.classification,
-            justification=prediction.justification,
-            classification_type=classification_type,
+    return ClassificationFunction(classifier, classification_type)
+
+
+DEFAULT_BATCH_MAX = 16
+DEFAULT_BATCH_WINDOW_MS = 10.0
+
+
+class BatchCoalescer:
+    """Coalesces concurrent single requests into ``ClassificationFunction.batch`` calls.
+
+    Each ``submit`` parks the request on a queue and awaits a future. A background task, started on
+    demand, flushes the queue as one batch when it reaches ``max_batch_size`` or when ``window_ms``
+    elapses, then resolves each future from its own outcome: a request whose prediction fails gets that
+    error, while the rest of the batch still gets its responses.
+    """
+
+    _CLOSED_MESSAGE = "Batch coalescer shut down before the request was classified"
+
+    def __init__(
+        self,
+        predictor: ClassificationFunction,
+        max_batch_size: int = DEFAULT_BATCH_MAX,
+        window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+    ) -> None:
+        # A batch size below 1 would never drain the queue and spin the event loop.
+        if max_batch_size < 1:
+            raise ValueError(f"DSPY_BATCH_MAX must be at least 1, got {max_batch_size}")
+        if window_ms < 0:
+            raise ValueError(f"DSPY_BATCH_WINDOW_MS must not be negative, got {window_ms}")
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.window_s = window_ms / 1000
+        self._pending: deque[tuple[ComplaintRequest, asyncio.Future[ComplaintResponse]]] = deque()
+        self._full = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def from_env(cls, predictor: ClassificationFunction) -> BatchCoalescer:
+        """Build a coalescer sized by ``DSPY_BATCH_MAX`` and ``DSPY_BATCH_WINDOW_MS``."""
+        return cls(
+            predictor,
+            max_batch_size=int(os.getenv("DSPY_BATCH_MAX") or DEFAULT_BATCH_MAX),
+            window_ms=float(os.getenv("DSPY_BATCH_WINDOW_MS") or DEFAULT_BATCH_WINDOW_MS),
         )
 
-    return _predict
-
-
-def get_ae_pc_classifier(use_cache: bool = True) -> Callable[[AEPCRequest], ComplaintResponse]:
+    async def submit(self, request: ComplaintRequest) -> ComplaintResponse:
+        future: asyncio.Future[ComplaintResponse] = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._full.set()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        return await future
+
+    async def _flush_loop(self) -> None:
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.window_s)
+            except TimeoutError:
+                pass
+            self._full.clear()
+
+            size = min(len(self._pending), self.max_batch_size)
+            batch = [self._pending.popleft() for _ in range(size)]
+            if len(self._pending) >= self.max_batch_size:
+                self._full.set()
+
+            # Dispatch without awaiting so the next window keeps filling while this batch runs.
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def aclose(self) -> None:
+        """Cancel the flush loop and in-flight batches, failing every request still waiting on them."""
+        tasks = [*self._inflight, *([self._flusher] if self._flusher is not None else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._fail(list(self._pending), RuntimeError(self._CLOSED_MESSAGE))
+        self._pending.clear()
+
+    @staticmethod
+    def _fail(batch: list[tuple[ComplaintRequest, asyncio.Future[ComplaintResponse]]], exc: BaseException) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _dispatch(self, batch: list[tuple[ComplaintRequest, asyncio.Future[ComplaintResponse]]]) -> None:
+        requests = [request for request, _ in batch]
+        try:
+            # dspy.asyncify runs on a worker thread bounded by async_max_workers and carries DSPy
+            # settings overrides and contextvars across to it.
+            outcomes = await dspy.asyncify(self.predictor.batch)(requests)
+        except asyncio.CancelledError:
+            self._fail(batch, RuntimeError(self._CLOSED_MESSAGE))
+            raise
+        except Exception as exc:  # noqa: BLE001 - no per-item outcomes exist, so every waiting caller gets it
+            self._fail(batch, exc)
+            return
+
+        for (_, future), outcome in zip(batch, outcomes, strict=True):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+def get_ae_pc_classifier(use_cache: bool = True) -> ClassificationFunction:
     """Get classifier for Adverse Event vs Product Complaint classification."""
     return _create_classification_function(ClassificationType.AE_PC, use_cache)
 
 
-def get_ae_category_classifier(use_cache: bool = True) -> Callable[[AECategoryRequest], ComplaintResponse]:
+def get_ae_category_classifier(use_cache: bool = True) -> ClassificationFunction:
     """Get classifier for Adverse Event category classification."""
     return _create_classification_function(ClassificationType.AE_CATEGORY, use_cache)
 
 
-def get_pc_category_classifier(use_cache: bool = True) -> Callable[[PCCategoryRequest], ComplaintResponse]:
+def get_pc_category_classifier(use_cache: bool = True) -> ClassificationFunction:
     """Get classifier for Product Complaint category classification."""
     return _create_classification_function(ClassificationType.PC_CATEGORY, use_cache)
 
@@ -173,17 +489,22 @@ def get_pc_category_classifier(use_cache: bool = True) -> Callable[[PCCategoryRe
 def get_classification_function(
     classification_type: ClassificationType = ClassificationType.AE_PC,
     use_cache: bool = True,
-) -> Callable[[ComplaintRequest], ComplaintResponse]:
+) -> ClassificationFunction:
     """Get a classification function for the requested classification type."""
     return _create_classification_function(classification_type, use_cache)
 
 
 __all__ = [
+    "INVALID_CLASSIFICATION",
+    "MIN_COMPLAINT_LENGTH",
+    "BatchCoalescer",
+    "ClassificationFunction",
     "ComplaintRequest",
     "AEPCRequest",
     "AECategoryRequest",
     "PCCategoryRequest",
     "ComplaintResponse",
+    "ComplaintError",
     "get_ae_pc_classifier",
     "get_ae_category_classifier",
     "get_pc_category_classifier",
@@ -0,0 +1,75 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.common.config import ensure_dspy_cache_dir
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="Run tests marked `integration` (real LLM calls); skipped by default.",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="integration test; pass --integration to run")
+    for item in items:
+        if item.get_closest_marker("integration") is not None:
+            item.add_marker(skip_integration)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Point DSPy's cache inside the repo workspace (and keep it writable) before any test module
+    # imports dspy, which reads DSPY_CACHEDIR once at import time.
+    ensure_dspy_cache_dir()
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run ``@pytest.mark.anyio`` tests (anyio's bundled pytest plugin) on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="module")
+async def async_client():
+    """In-process async API client shared by every test in a module.
+
+    ``ASGITransport`` does not run the app lifespan, which is intended: the lifespan would call
+    ``configure_lm`` again, and tests wire ``app.state`` predictors themselves instead.
+    """
+
+    # Imported here rather than at module level so dspy loads after pytest_configure sets DSPY_CACHEDIR.
+    from src.api.app import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def echo_predictor():
+    """AE-PC ``ClassificationFunction`` over a stub that answers ``label:<complaint>`` without an LM.
+
+    The complaint ``"boom"`` raises ``RuntimeError("upstream failure")`` to exercise failure paths.
+    """
+
+    # Imported here rather than at module level so dspy loads after pytest_configure sets DSPY_CACHEDIR.
+    import dspy
+
+    from src.common.types import ClassificationType
+    from src.serving.service import ClassificationFunction
+
+    class EchoClassifier(dspy.Module):
+        def forward(self, complaint: str) -> dspy.Prediction:
+            if complaint == "boom":
+                raise RuntimeError("upstream failure")
+            return dspy.Prediction(classification=f"label:{complaint}", justification="echo")
+
+    return ClassificationFunction(EchoClassifier(), ClassificationType.AE_PC)
@@ -0,0 +1,74 @@
+"""Unit tests for the FastAPI application lifespan (no LLM calls)."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+
+import pytest
+from fastapi import FastAPI, status
+
+from src.common.types import ClassificationType
+
+# ``src.api`` re-exports the FastAPI instance as ``app``, shadowing the submodule.
+app_module = importlib.import_module("src.api.app")
+
+
+@pytest.fixture
+def echo_app(monkeypatch: pytest.MonkeyPatch, echo_predictor):
+    state = app_module.app.state
+    monkeypatch.setattr(state, "ae_pc_predictor", echo_predictor, raising=False)
+    monkeypatch.setattr(state, "errors", {}, raising=False)
+    monkeypatch.setattr(state, "coalescers", {}, raising=False)
+
+
+def test_lifespan_does_not_wait_past_warmup_timeout(monkeypatch: pytest.MonkeyPatch):
+    release = threading.Event()
+
+    def stalled_predictor(request):
+        release.wait(timeout=5)
+
+    monkeypatch.setattr(app_module, "configure_lm", lambda: None)
+    for loader in ("get_ae_pc_classifier", "get_ae_category_classifier", "get_pc_category_classifier"):
+        monkeypatch.setattr(app_module, loader, lambda: stalled_predictor)
+    monkeypatch.delenv("DSPY_SKIP_WARMUP", raising=False)
+    monkeypatch.delenv("DSPY_BATCH_COALESCE", raising=False)
+    monkeypatch.setenv("DSPY_WARMUP_TIMEOUT_S", "0.05")
+
+    async def start_up() -> FastAPI:
+        target = FastAPI()
+        try:
+            async with app_module._lifespan(target):
+                pass
+        finally:
+            # Unblock the abandoned warmup threads so asyncio.run can shut its executor down.
+            release.set()
+        return target
+
+    target = asyncio.run(asyncio.wait_for(start_up(), timeout=2))
+
+    assert target.state.ae_pc_predictor is stalled_predictor
+    assert target.state.errors == {}
+
+
+@pytest.mark.anyio
+async def test_batch_route_reports_failed_item_without_failing_batch(echo_app, async_client):
+    resp = await async_client.post(
+        "/classify/ae-pc/batch", json=[{"complaint": "nausea"}, {"complaint": "boom"}, {"complaint": "rash"}]
+    )
+
+    assert resp.status_code == status.HTTP_200_OK
+    nausea, boom, rash = resp.json()
+    assert nausea["classification"] == "label:nausea"
+    assert boom == {"error": "Classification failed: RuntimeError", "classification_type": ClassificationType.AE_PC}
+    assert rash["classification"] == "label:rash"
+
+
+@pytest.mark.anyio
+async def test_batch_route_rejects_oversized_payload(echo_app, async_client):
+    payload = [{"complaint": "nausea"}] * (app_module.MAX_BATCH_ITEMS + 1)
+
+    resp = await async_client.post("/classify/ae-pc/batch", json=payload)
+
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
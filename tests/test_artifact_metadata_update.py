@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
 
+import pytest
+
+from src.serving import service
 from src.serving.service import _update_artifact_model_metadata
 
 
+@pytest.fixture(autouse=True)
+def _clear_artifact_model_cache(monkeypatch):
+    monkeypatch.setattr(service, "_ARTIFACT_MODEL_CACHE", {})
+
+
 def test_update_artifact_model_metadata_updates_model(tmp_path):
     model_path = tmp_path / "artifact.json"
     model_path.write_text(
@@ -39,3 +48,42 @@ def test_update_artifact_model_metadata_adds_metadata(tmp_path):
 
     data = json.loads(model_path.read_text(encoding="utf-8"))
     assert data["metadata"]["model"] == "new-model"
+
+
+def test_update_artifact_model_metadata_skips_parse_when_unchanged(tmp_path, monkeypatch):
+    model_path = tmp_path / "artifact.json"
+    model_path.write_text(json.dumps({"metadata": {"model": "old-model"}}), encoding="utf-8")
+    _update_artifact_model_metadata(model_path, "new-model")
+
+    def fail_loads(_data):
+        raise AssertionError("artifact should not be parsed again")
+
+    monkeypatch.setattr(service.orjson, "loads", fail_loads)
+    _update_artifact_model_metadata(model_path, "new-model")
+
+
+def test_update_artifact_model_metadata_ignores_touch_without_content_change(tmp_path, monkeypatch):
+    model_path = tmp_path / "artifact.json"
+    model_path.write_text(json.dumps({"metadata": {"model": "same-model"}}), encoding="utf-8")
+    _update_artifact_model_metadata(model_path, "same-model")
+
+    def fail_loads(_data):
+        raise AssertionError("artifact should not be parsed again")
+
+    monkeypatch.setattr(service.orjson, "loads", fail_loads)
+    os.utime(model_path, ns=(0, model_path.stat().st_mtime_ns + 1_000_000_000))
+    _update_artifact_model_metadata(model_path, "same-model")
+
+
+def test_update_artifact_model_metadata_fsyncs_when_enabled(tmp_path, monkeypatch):
+    model_path = tmp_path / "artifact.json"
+    model_path.write_text(json.dumps({"metadata": {"model": "old-model"}}), encoding="utf-8")
+    synced: list[int] = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(service.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    monkeypatch.setenv("DSPY_ARTIFACT_FSYNC", "1")
+
+    _update_artifact_model_metadata(model_path, "new-model")
+
+    assert len(synced) == 2
+    assert json.loads(model_path.read_text(encoding="utf-8"))["metadata"]["model"] == "new-model"
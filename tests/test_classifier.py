@@ -0,0 +1,38 @@
+"""Unit tests for the shared classifier helpers (no LLM calls)."""
+
+from __future__ import annotations
+
+import dspy
+import pytest
+
+from src.common.classifier import evaluate_model
+
+
+class _FailOnBadClassifier(dspy.Module):
+    """Labels every complaint correctly except those starting with "bad", which raise."""
+
+    def forward(self, complaint: str) -> dspy.Prediction:
+        if complaint.startswith("bad"):
+            raise ValueError(f"cannot classify {complaint}")
+        return dspy.Prediction(classification="Adverse Event", justification="stub")
+
+
+def _example(complaint: str) -> dspy.Example:
+    return dspy.Example(complaint=complaint, classification="Adverse Event").with_inputs("complaint")
+
+
+def test_evaluate_model_scores_dataset():
+    dataset = [_example(f"complaint {i}") for i in range(4)]
+
+    assert evaluate_model(_FailOnBadClassifier(), dataset, "Test Set") == 1.0
+
+
+def test_evaluate_model_raises_first_failure_in_dataset_order():
+    # More failures than DSPy's default max_errors (10), which would otherwise cancel with a generic error.
+    dataset = [_example("ok 0"), _example("bad 1"), *(_example(f"bad {i}") for i in range(2, 14))]
+
+    with pytest.raises(RuntimeError, match=r"Test Set example 2/14") as excinfo:
+        evaluate_model(_FailOnBadClassifier(), dataset, "Test Set")
+
+    assert isinstance(excinfo.value.__cause__, ValueError)
+    assert str(excinfo.value.__cause__) == "cannot classify bad 1"
@@ -0,0 +1,116 @@
+"""Unit tests for LM configuration loading."""
+
+from __future__ import annotations
+
+import dspy
+import pytest
+from pydantic import ValidationError
+
+from src.common import config
+from src.common.config import configure_lm, get_display_model_name, load_llm_config
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(monkeypatch, tmp_path):
+    # Run from an empty directory so a developer's .env does not leak into the settings.
+    monkeypatch.chdir(tmp_path)
+    for name in (
+        "DSPY_PROVIDER",
+        "DSPY_MODEL_NAME",
+        "DSPY_LOCAL_BASE",
+        "OPENROUTER_API_KEY",
+        "DSPY_HTTP_HEADERS",
+        "OPENROUTER_HTTP_REFERER",
+        "OPENROUTER_APP_TITLE",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    load_llm_config.cache_clear()
+    yield monkeypatch
+    load_llm_config.cache_clear()
+
+
+def test_load_llm_config_is_cached(isolated_env):
+    isolated_env.setenv("DSPY_PROVIDER", "local")
+
+    first = load_llm_config()
+    isolated_env.setenv("DSPY_MODEL_NAME", "other-model")
+
+    assert load_llm_config() is first
+    load_llm_config.cache_clear()
+    assert load_llm_config().model == "openai/other-model"
+
+
+def test_load_llm_config_is_frozen(isolated_env):
+    isolated_env.setenv("DSPY_PROVIDER", "local")
+
+    cfg = load_llm_config()
+
+    with pytest.raises(ValidationError):
+        cfg.model = "mutated"
+
+
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [
+        ("openrouter/nvidia/nemotron-3-nano-30b-a3b:free", "nvidia/nemotron-3-nano-30b-a3b:free"),
+        ("openai/local-model", "local-model"),
+        ("nvidia/nemotron-3-nano-30b-a3b:free", "nvidia/nemotron-3-nano-30b-a3b:free"),
+        ("plain-model", "plain-model"),
+    ],
+)
+def test_get_display_model_name_strips_provider_prefix(model, expected):
+    assert get_display_model_name(model) == expected
+
+
+def test_load_llm_config_dispatches_local_provider(isolated_env):
+    isolated_env.setenv("DSPY_PROVIDER", "LOCAL")
+
+    cfg = load_llm_config()
+
+    assert cfg.model.startswith("openai/")
+    assert cfg.is_local
+
+
+def test_load_llm_config_defaults_to_openrouter(isolated_env):
+    isolated_env.setenv("DSPY_PROVIDER", "something-else")
+    isolated_env.setenv("OPENROUTER_API_KEY", "test-key")
+
+    cfg = load_llm_config()
+
+    assert cfg.model.startswith("openrouter/")
+    assert cfg.is_openrouter
+    assert cfg.api_key == "test-key"
+
+
+def test_load_llm_config_merges_extra_headers(isolated_env):
+    isolated_env.setenv("OPENROUTER_API_KEY", "test-key")
+    isolated_env.setenv("DSPY_HTTP_HEADERS", '{"X-Title": "From JSON", "X-Custom": "1"}')
+    isolated_env.setenv("OPENROUTER_HTTP_REFERER", "https://example.com")
+    isolated_env.setenv("OPENROUTER_APP_TITLE", "Ignored")
+
+    cfg = load_llm_config()
+
+    assert cfg.headers == {"X-Title": "From JSON", "X-Custom": "1", "HTTP-Referer": "https://example.com"}
+
+
+def test_load_llm_config_rejects_invalid_header_json(isolated_env):
+    isolated_env.setenv("OPENROUTER_API_KEY", "test-key")
+    isolated_env.setenv("DSPY_HTTP_HEADERS", "{not json")
+
+    with pytest.raises(ValueError, match="DSPY_HTTP_HEADERS"):
+        load_llm_config()
+
+
+def test_configure_lm_caches_display_model_name(isolated_env):
+    isolated_env.setenv("DSPY_PROVIDER", "local")
+    isolated_env.setenv("DSPY_MODEL_NAME", "local-model")
+    isolated_env.setattr(config, "_CONFIGURED_DISPLAY_NAME", None)
+    # Keep the test from touching the real cache directory or the process-wide DSPy settings.
+    isolated_env.setattr(config, "ensure_dspy_cache_dir", lambda: None)
+    configured: dict[str, object] = {}
+    isolated_env.setattr(dspy, "configure", lambda **kwargs: configured.update(kwargs))
+
+    lm = configure_lm()
+
+    assert configured["lm"] is lm
+    assert get_display_model_name() == "local-model"
@@ -2,26 +2,58 @@
 
 from __future__ import annotations
 
-import os
+import hashlib
 from pathlib import Path
 
-import httpx
+import openai
 import pytest
-from fastapi.testclient import TestClient
-
-# Ensure DSPy cache writes land inside the repo workspace (and stay writable).
-DSPY_CACHE_DIR = Path("data/.dspy_cache")
-DSPY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-os.environ.setdefault("DSPY_CACHEDIR", str(DSPY_CACHE_DIR))
-
-# Imports must come after environment setup
-from src.api.app import app  # noqa: E402
-from src.common.config import configure_lm  # noqa: E402
-from src.serving.service import AEPCRequest, get_ae_pc_classifier  # noqa: E402
-
-
-def _ensure_predictor():
-    """Configure LM + load predictor, skipping when pre-reqs are missing."""
+from fastapi import HTTPException, status
+
+from src.api.app import app
+from src.common.config import configure_lm, get_display_model_name
+from src.common.paths import get_classifier_artifact_path
+from src.serving.service import (
+    AEPCRequest,
+    ClassificationFunction,
+    ComplaintRequest,
+    ComplaintResponse,
+    get_ae_pc_classifier,
+)
+
+
+class _RecordingPredictor:
+    """Replays responses recorded in the pytest cache and records live ones on a miss.
+
+    Recordings are keyed by the configured model and a digest of the artifact as well as the complaint, so a
+    retrained artifact or a different ``DSPY_MODEL_NAME`` misses and calls the LLM again. Recordings live under
+    ``.pytest_cache``; run ``pytest --cache-clear`` to force fresh LLM calls.
+    """
+
+    def __init__(self, predictor: ClassificationFunction, cache: pytest.Cache, artifact_path: Path) -> None:
+        self._predictor = predictor
+        self._cache = cache
+        fingerprint = hashlib.blake2b(digest_size=16)
+        fingerprint.update((get_display_model_name() or "").encode("utf-8"))
+        fingerprint.update(b"\0")
+        fingerprint.update(artifact_path.read_bytes())
+        self._fingerprint = fingerprint
+
+    def __call__(self, request: ComplaintRequest) -> ComplaintResponse:
+        hasher = self._fingerprint.copy()
+        hasher.update(b"\0")
+        hasher.update(request.complaint.encode("utf-8"))
+        key = f"dspy-llm/{self._predictor.classification_type}/{hasher.hexdigest()}"
+        recorded = self._cache.get(key, None)
+        if recorded is not None:
+            return ComplaintResponse.model_validate(recorded)
+        response = self._predictor(request)
+        self._cache.set(key, response.model_dump())
+        return response
+
+
+@pytest.fixture(scope="session")
+def predictor(request):
+    """Configure LM + load predictor once per session, skipping when pre-reqs are missing."""
 
     try:
         configure_lm()
@@ -29,49 +61,112 @@ def _ensure_predictor():
         pytest.skip(f"LLM configuration not available: {exc}")
 
     try:
-        return get_ae_pc_classifier()
+        loaded = get_ae_pc_classifier()
     except FileNotFoundError as exc:
         pytest.skip(f"Classifier artifact missing: {exc}")
 
+    cache = getattr(request.config, "cache", None)  # None when run with -p no:cacheprovider
+    if cache is None:
+        return loaded
+    return _RecordingPredictor(loaded, cache, get_classifier_artifact_path(loaded.classification_type))
+
+
+# Prefix of the 503 detail raised by ``wired_app`` for transient LLM failures. Any other 503 (for example a
+# missing classifier) is a real failure, not a skip.
+_LLM_FAILURE_DETAIL = "LLM invocation failed"
+
+
+@pytest.fixture
+def wired_app(monkeypatch, predictor):
+    """Serve the session predictor from ``app.state``; monkeypatch restores the previous state.
+
+    Transient LLM failures are turned into a 503 inside the route, since a ``pytest.skip`` raised
+    there would not survive the ASGI middleware stack.
+    """
+
+    def guarded_predictor(payload: ComplaintRequest) -> ComplaintResponse:
+        try:
+            return predictor(payload)
+        except Exception as exc:
+            if not _is_transient_llm_error(exc):
+                raise
+            raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, f"{_LLM_FAILURE_DETAIL}: {exc}") from exc
+
+    monkeypatch.setattr(app.state, "ae_pc_predictor", guarded_predictor, raising=False)
+    monkeypatch.setattr(app.state, "errors", {}, raising=False)
+    monkeypatch.setattr(app.state, "coalescers", {}, raising=False)
+    return app
+
+
+def _is_transient_llm_error(exc: BaseException) -> bool:
+    """True for provider-side failures (network, rate limits, 5xx) that should skip rather than fail.
+
+    LiteLLM's exceptions subclass the OpenAI SDK ones, and newer DSPy releases re-raise them wrapped in
+    their own LM errors, so walk the cause chain for an OpenAI error. Matching on the SDK classes also
+    avoids importing litellm (and its model-cost-map fetch) at collection time.
+    """
+    while exc is not None:
+        if isinstance(exc, openai.APIConnectionError):  # includes timeouts
+            return True
+        if isinstance(exc, openai.APIStatusError):
+            return exc.status_code == 429 or exc.status_code >= 500
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+# Both tests classify this complaint, so on a cold recording cache the endpoint test replays the
+# response recorded by the predictor test instead of paying for a second LLM round-trip.
+AE_COMPLAINT = "After injecting Ozempic my throat started swelling and I needed an EpiPen."
+
 
 def _invoke_llm(predictor, payload: AEPCRequest):
     """Call the predictor but treat transient HTTP failures as skips."""
 
     try:
         return predictor(payload)
-    except Exception as exc:  # noqa: BLE001 - any upstream HTTP failure should skip the test
-        pytest.skip(f"LLM invocation failed: {exc}")
+    except Exception as exc:
+        if not _is_transient_llm_error(exc):
+            raise
+        pytest.skip(f"{_LLM_FAILURE_DETAIL}: {exc}")
 
 
-@pytest.mark.integration
-def test_predictor_classifies_complaint():
-    predictor = _ensure_predictor()
+AE_PC_LABELS = {"Adverse Event", "Product Complaint"}
 
-    payload = AEPCRequest(complaint="After injecting Ozempic my throat started swelling and I needed an EpiPen.")
-    response = _invoke_llm(predictor, payload)
 
-    assert response.classification in {"Adverse Event", "Product Complaint"}
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "complaint",
+    [
+        AE_COMPLAINT,
+        "I have had constant nausea and vomiting since my dose was increased to 1 mg.",
+        "My blood sugar dropped to 48 twice this week after starting Ozempic with my insulin.",
+        "Severe upper abdominal pain radiating to my back; the ER said it was pancreatitis.",
+        "The pen arrived with a cracked dose dial and I could not select a dose.",
+        "The package was warm to the touch when delivered and the cold pack had melted.",
+        "The needle snapped off inside the pen cap when I tried to attach it.",
+        "The label on the carton is misprinted and the lot number is unreadable.",
+    ],
+)
+def test_predictor_classifies_complaint(predictor, complaint):
+    response = _invoke_llm(predictor, AEPCRequest(complaint=complaint))
+
+    assert response.classification in AE_PC_LABELS
     assert response.justification
 
 
 @pytest.mark.integration
-def test_fastapi_endpoint_uses_loaded_predictor():
-    predictor = _ensure_predictor()
-    # Mock the loaded predictor in the app state
-    app.state.ae_pc_predictor = predictor
-    # Ensure errors dict exists
-    app.state.errors = {}
-
-    client = TestClient(app)
-    try:
-        resp = client.post(
-            "/classify/ae-pc",
-            json={"complaint": "My Ozempic pen arrived cracked and leaking."},
-        )
-    except (httpx.HTTPError, Exception) as exc:  # pragma: no cover - network/transient
-        pytest.skip(f"HTTP call failed: {exc}")
+@pytest.mark.anyio
+async def test_fastapi_endpoint_uses_loaded_predictor(async_client, wired_app):
+    resp = await async_client.post(
+        "/classify/ae-pc",
+        json={"complaint": AE_COMPLAINT},
+    )
+    if resp.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:  # pragma: no cover - network/transient
+        detail = resp.json()["detail"]
+        if detail.startswith(_LLM_FAILURE_DETAIL):
+            pytest.skip(detail)
 
     assert resp.status_code == 200
     payload = resp.json()
-    assert payload["classification"] in {"Adverse Event", "Product Complaint"}
+    assert payload["classification"] in AE_PC_LABELS
     assert payload["justification"]
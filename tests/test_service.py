@@ -0,0 +1,225 @@
+"""Unit tests for the serving-layer classification function (no LLM calls)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import dspy
+import pytest
+
+from src.common.types import ClassificationType
+from src.serving import service
+from src.serving.service import INVALID_CLASSIFICATION, AEPCRequest, BatchCoalescer, ClassificationFunction
+
+
+class _TraceProbe(dspy.Module):
+    """Records whether DSPy tracing was active for each call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.trace_enabled: list[bool] = []
+
+    def forward(self, complaint: str) -> dspy.Prediction:
+        self.trace_enabled.append(dspy.settings.trace is not None)
+        return dspy.Prediction(classification=complaint, justification="probe")
+
+
+@pytest.fixture
+def predictor(echo_predictor) -> ClassificationFunction:
+    return echo_predictor
+
+
+def test_single_prediction(predictor):
+    response = predictor(AEPCRequest(complaint="nausea"))
+
+    assert response.classification == "label:nausea"
+    assert response.justification == "echo"
+    assert response.classification_type == ClassificationType.AE_PC
+
+
+def test_batch_preserves_request_order(predictor):
+    complaints = [f"complaint {i}" for i in range(10)]
+
+    responses = predictor.batch([AEPCRequest(complaint=c) for c in complaints])
+
+    assert [r.classification for r in responses] == [f"label:{c}" for c in complaints]
+
+
+def test_batch_empty(predictor):
+    assert predictor.batch([]) == []
+
+
+def test_batch_reports_failures_per_item(predictor):
+    # More failures than DSPy's default max_errors (10), which would otherwise cancel the whole batch.
+    complaints = ["boom"] * 12 + ["nausea"]
+
+    outcomes = predictor.batch([AEPCRequest(complaint=c) for c in complaints])
+
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes[:12])
+    assert outcomes[12].classification == "label:nausea"
+
+
+def test_coalescer_groups_concurrent_requests(predictor, monkeypatch):
+    batch_sizes: list[int] = []
+    original_batch = predictor.batch
+
+    def recording_batch(requests):
+        batch_sizes.append(len(requests))
+        return original_batch(requests)
+
+    monkeypatch.setattr(predictor, "batch", recording_batch)
+    complaints = [f"complaint {i}" for i in range(5)]
+
+    async def run():
+        coalescer = BatchCoalescer(predictor, max_batch_size=4, window_ms=50)
+        return await asyncio.gather(*(coalescer.submit(AEPCRequest(complaint=c)) for c in complaints))
+
+    responses = asyncio.run(run())
+
+    assert [r.classification for r in responses] == [f"label:{c}" for c in complaints]
+    assert batch_sizes == [4, 1]
+
+
+def test_coalescer_fails_only_the_failing_request(predictor):
+    async def run():
+        coalescer = BatchCoalescer(predictor, max_batch_size=3, window_ms=50)
+        return await asyncio.gather(
+            coalescer.submit(AEPCRequest(complaint="first")),
+            coalescer.submit(AEPCRequest(complaint="boom")),
+            coalescer.submit(AEPCRequest(complaint="third")),
+            return_exceptions=True,
+        )
+
+    first, boom, third = asyncio.run(run())
+
+    assert isinstance(boom, RuntimeError)
+    assert first.classification == "label:first"
+    assert third.classification == "label:third"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "env_var"),
+    [
+        ({"max_batch_size": 0}, "DSPY_BATCH_MAX"),
+        ({"max_batch_size": -1}, "DSPY_BATCH_MAX"),
+        ({"window_ms": -5}, "DSPY_BATCH_WINDOW_MS"),
+    ],
+)
+def test_coalescer_rejects_invalid_settings(predictor, kwargs, env_var):
+    with pytest.raises(ValueError, match=env_var):
+        BatchCoalescer(predictor, **kwargs)
+
+
+def test_coalescer_aclose_fails_inflight_and_pending_requests(predictor, monkeypatch):
+    release = threading.Event()
+
+    def stalled_batch(requests):
+        release.wait(timeout=5)
+        return [predictor(r) for r in requests]
+
+    monkeypatch.setattr(predictor, "batch", stalled_batch)
+
+    async def run():
+        coalescer = BatchCoalescer(predictor, max_batch_size=2, window_ms=10_000)
+        submits = [asyncio.ensure_future(coalescer.submit(AEPCRequest(complaint=f"complaint {i}"))) for i in range(3)]
+        await asyncio.sleep(0.05)  # the first two go out as a full batch; the third waits for the window
+        try:
+            await coalescer.aclose()
+            return await asyncio.wait_for(asyncio.gather(*submits, return_exceptions=True), timeout=1)
+        finally:
+            release.set()
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_cached_classifier_reloads_when_artifact_changes(tmp_path, monkeypatch):
+    loads: list[Path] = []
+    monkeypatch.setattr(service, "_load_classifier", lambda path, _type: loads.append(path) or object())
+    service._cached_classifier.cache_clear()
+    artifact = tmp_path / "artifact.json"
+    artifact.write_text("{}", encoding="utf-8")
+
+    first = service._cached_classifier(artifact, ClassificationType.AE_PC)
+    assert service._cached_classifier(artifact, ClassificationType.AE_PC) is first
+
+    os.utime(artifact, ns=(0, artifact.stat().st_mtime_ns + 1))
+    assert service._cached_classifier(artifact, ClassificationType.AE_PC) is not first
+    assert len(loads) == 2
+    service._cached_classifier.cache_clear()
+
+
+def test_cached_classifier_does_not_reload_after_metadata_rewrite(tmp_path, monkeypatch):
+    artifact = tmp_path / "artifact.json"
+    artifact.write_text("{}", encoding="utf-8")
+    loads: list[Path] = []
+
+    def load_and_rewrite(path, _type):
+        # Mimics DSPY_ARTIFACT_AUTO_UPDATE rewriting the artifact's metadata during the load.
+        loads.append(path)
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        return object()
+
+    monkeypatch.setattr(service, "_load_classifier", load_and_rewrite)
+    service._cached_classifier.cache_clear()
+
+    first = service._cached_classifier(artifact, ClassificationType.AE_PC)
+
+    assert service._cached_classifier(artifact, ClassificationType.AE_PC) is first
+    assert len(loads) == 1
+    service._cached_classifier.cache_clear()
+
+
+@pytest.mark.parametrize("disable_trace", [False, True])
+def test_disable_trace_applies_to_single_and_batch(monkeypatch, disable_trace):
+    monkeypatch.setattr(service, "_DISABLE_TRACE", disable_trace)
+    probe = _TraceProbe()
+    predictor = ClassificationFunction(probe, ClassificationType.AE_PC)
+
+    predictor(AEPCRequest(complaint="single"))
+    predictor.batch([AEPCRequest(complaint="first"), AEPCRequest(complaint="second")])
+
+    assert probe.trace_enabled == [not disable_trace] * 3
+
+
+@pytest.mark.parametrize("complaint", ["", "   ", "ab", " a \n"])
+def test_short_complaint_skips_classifier(predictor, complaint):
+    response = predictor(AEPCRequest(complaint=complaint))
+
+    assert response.classification == INVALID_CLASSIFICATION
+    assert response.classification_type == ClassificationType.AE_PC
+
+
+def test_batch_mixes_invalid_and_classified_in_order(predictor):
+    responses = predictor.batch(
+        [AEPCRequest(complaint="nausea"), AEPCRequest(complaint=" "), AEPCRequest(complaint="rash")]
+    )
+
+    assert [r.classification for r in responses] == ["label:nausea", INVALID_CLASSIFICATION, "label:rash"]
+
+
+def test_response_cache_skips_classifier_on_repeat():
+    probe = _TraceProbe()
+    predictor = ClassificationFunction(probe, ClassificationType.AE_PC, response_cache_size=2)
+
+    first = predictor(AEPCRequest(complaint="nausea"))
+    responses = predictor.batch([AEPCRequest(complaint="nausea"), AEPCRequest(complaint="rash")])
+
+    assert responses[0] is first
+    assert [r.classification for r in responses] == ["nausea", "rash"]
+    assert len(probe.trace_enabled) == 2
+
+
+def test_response_cache_evicts_least_recently_used():
+    probe = _TraceProbe()
+    predictor = ClassificationFunction(probe, ClassificationType.AE_PC, response_cache_size=1)
+
+    predictor(AEPCRequest(complaint="nausea"))
+    predictor(AEPCRequest(complaint="rash"))
+    predictor(AEPCRequest(complaint="nausea"))
+
+    assert len(probe.trace_enabled) == 3